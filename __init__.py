@@ -16,7 +16,7 @@ Features:
 - **PKCE Compliance**: Generates code verifiers with lengths between 43 and 128 characters, ensuring compatibility with the PKCE standard.
 - **Secure Hashing**: Supports the `S256` hashing method (recommended) for code challenges, along with an optional `plain` method.
 - **Random State & Nonce Generation**: Generates cryptographically secure random values for state and nonce parameters.
-- **Customizable Parameters**: Allows users to specify lengths for code verifiers, states, and nonces.
+- **Customizable Parameters**: Allows users to specify lengths for code verifiers, states, and nonces. Lengths are given in random bytes; `code_verifier_length` must be between 32 and 96 bytes (43 to 128 characters). Earlier versions also accepted 97 to 128 bytes, which produced verifiers longer than PKCE allows.
 - **Convenient Payload Generation**: Provides a static method to generate URL-encoded OAuth2 payloads, making integration simple and efficient.
 
 Installation:
@@ -88,7 +88,7 @@ payload, code_verifier = pkcegen.pkce(
     redirect_uri="Your Redirect URI",   # Replace with the URI where users will be redirected after authentication. This should match what is registered with your OAuth2 provider.
     scope="Your scope",                 # Replace with the scope of permissions your application needs.
     code_challenge_method="S256",       # Specify the method for generating the code challenge. Here, "S256" is used, which means the code challenge will be generated using SHA-256 hashing.
-    code_verifier_length=64,            # Custom length for the code verifier. A longer verifier adds more security. The length should be between 43 and 128 characters.
+    code_verifier_length=64,            # Custom length for the code verifier, in random bytes. A longer verifier adds more security. The length should be between 32 and 96 bytes (43 to 128 characters).
     state_length=32,                    # Custom length for the state parameter. A longer state can increase security by adding more entropy.
     nonce_length=32                     # Custom length for the nonce parameter. A longer nonce increases security by adding more randomness.
 )
@@ -98,12 +98,243 @@ print("Payload:", payload)
 print("Code Verifier:", code_verifier)
 ```
 """
-import urllib.parse
-import base64
-import hashlib
+import binascii
 import os
 
-@staticmethod
+# Maps the standard base64 alphabet onto the URL-safe one.
+_URLSAFE = bytes.maketrans(b'+/', b'-_')
+
+# Heavy dependencies are bound by _load_backends() on first use, keeping `import pkcegen` cheap.
+_quote_plus = None
+_sha256 = None
+
+def _load_backends():
+    """
+    Import the quoting and hashing backends if not already loaded.
+    """
+    global _quote_plus, _sha256
+    if _sha256 is not None:
+        return
+
+    from urllib.parse import quote_plus as _quote_plus
+    try:
+        # Bind OpenSSL's SHA-256 constructor directly, skipping hashlib's name lookup.
+        from _hashlib import openssl_sha256 as _sha256
+    except ImportError:
+        from hashlib import sha256 as _sha256
+
+def _quote(value) -> bytes:
+    """
+    Quote a payload field the way `urllib.parse.urlencode` does.
+
+    Args:
+        value: The field value; anything other than bytes is converted with `str()` first.
+
+    Returns:
+        bytes: The quoted value, as ASCII bytes.
+    """
+    if not isinstance(value, bytes):
+        value = str(value)
+    return _quote_plus(value).encode('ascii')
+
+def _validate_lengths(code_verifier_length: int, state_length: int, nonce_length: int):
+    """
+    Validate the requested code verifier, state and nonce lengths.
+
+    Lengths count random bytes; 32 to 96 bytes encode to the 43 to 128 characters PKCE requires.
+
+    Args:
+        code_verifier_length (int): Length of the code verifier.
+        state_length (int): Length of the state parameter.
+        nonce_length (int): Length of the nonce parameter.
+
+    Raises:
+        TypeError: If any length is not an integer.
+        ValueError: If the code verifier length is out of range or the state or nonce length is negative.
+    """
+    if not all(isinstance(length, int) for length in (code_verifier_length, state_length, nonce_length)):
+        raise TypeError("Code verifier, state and nonce lengths must be integers.")
+    if not 32 <= code_verifier_length <= 96:
+        raise ValueError("Code verifier length must be between 32 and 96 bytes (43 to 128 characters).")
+    if state_length < 0 or nonce_length < 0:
+        raise ValueError("State and nonce lengths must not be negative.")
+
+# Layouts computed by _layout, keyed by the tuple of token lengths.
+_LAYOUTS = {}
+
+def _layout(lengths: tuple) -> tuple:
+    """
+    Compute the buffer layout used by `_tokens` for one group of token lengths.
+
+    The layout only depends on the lengths, so it is cached per group. Its size is a multiple of 3,
+    so repeated groups share the same layout at a fixed stride.
+
+    Args:
+        lengths (tuple): Number of random bytes behind each token.
+
+    Returns:
+        Tuple[int, tuple, tuple]: Buffer size, zero-padding ranges and output slice bounds.
+
+    Raises:
+        TypeError: If a length is not an integer.
+        ValueError: If a length is negative.
+    """
+    layout = _LAYOUTS.get(lengths)
+    if layout is not None:
+        return layout
+
+    pads = []
+    slices = []
+    offset = 0
+    for length in lengths:
+        # A negative or fractional length would shift every following segment and pad range.
+        if not isinstance(length, int):
+            raise TypeError("Token lengths must be integers.")
+        if length < 0:
+            raise ValueError("Token lengths must not be negative.")
+        end = offset + length
+        gap = -length % 3
+        if gap:
+            pads.append((end, end + gap, bytes(gap)))
+        start = offset // 3 * 4
+        slices.append((start, start + (length * 4 + 2) // 3))
+        offset = end + gap
+
+    # A deployment normally uses a handful of length combinations; start over if that assumption breaks.
+    if len(_LAYOUTS) >= 32:
+        _LAYOUTS.clear()
+    layout = _LAYOUTS[lengths] = (offset, tuple(pads), tuple(slices))
+    return layout
+
+def _tokens(*lengths: int, count: int = 1) -> list:
+    """
+    Generate one unpadded base64url token per requested byte length.
+
+    Each segment is zero-padded to a 3-byte boundary, so a single base64 pass over the
+    joined buffer encodes every token exactly as if it had been encoded on its own.
+
+    Args:
+        *lengths (int): Number of random bytes behind each token.
+        count (int): Number of times to generate the whole group of tokens.
+
+    Returns:
+        list: The generated tokens as ASCII bytes, in the order of `lengths`, group after group.
+    """
+    size, pads, slices = _layout(lengths)
+    stride = size // 3 * 4
+
+    buf = bytearray(os.urandom(size * count))
+    if pads:
+        for i in range(count):
+            base = i * size
+            for start, end, zeros in pads:
+                buf[base + start:base + end] = zeros
+
+    encoded = binascii.b2a_base64(buf, newline=False).translate(_URLSAFE)
+    return [encoded[base + start:base + end]
+            for base in [i * stride for i in range(count)]
+            for start, end in slices]
+
+def _code_c_s256(code_verifier: bytes) -> bytes:
+    """
+    Generate an S256 code challenge based on the code verifier.
+
+    Args:
+        code_verifier (bytes): The code verifier, as ASCII bytes.
+
+    Returns:
+        bytes: The generated code challenge, as ASCII bytes.
+    """
+    code_challenge = _sha256(code_verifier).digest()
+    # A 32-byte digest always encodes to 43 characters plus a single '='.
+    return binascii.b2a_base64(code_challenge, newline=False)[:43].translate(_URLSAFE)
+
+def _code_c_plain(code_verifier: bytes) -> bytes:
+    """
+    Generate a plain code challenge, which is the code verifier itself.
+
+    Args:
+        code_verifier (bytes): The code verifier, as ASCII bytes.
+
+    Returns:
+        bytes: The generated code challenge, as ASCII bytes.
+    """
+    return code_verifier
+
+def _code_c_for(code_challenge_method: str):
+    """
+    Look up the code challenge implementation for a method.
+
+    Args:
+        code_challenge_method (str): The method for code challenge generation ("S256" or "plain").
+
+    Returns:
+        Callable[[bytes], bytes]: The code challenge implementation.
+
+    Raises:
+        ValueError: If the code challenge method is not supported.
+    """
+    if code_challenge_method == "S256":
+        return _code_c_s256
+    if code_challenge_method == "plain":
+        return _code_c_plain
+    raise ValueError("Unsupported code_challenge_method. Choose either 'S256' or 'plain'.")
+
+def _build_payload(quoted_client_id: bytes, quoted_scope: bytes, quoted_redirect_uri: bytes,
+                   code_challenge: bytes, quoted_method: bytes, state: bytes, nonce: bytes) -> str:
+    """
+    Assemble the URL-encoded OAuth2 payload from already-quoted fields.
+
+    Args:
+        quoted_client_id (bytes): The quoted client ID.
+        quoted_scope (bytes): The quoted scope.
+        quoted_redirect_uri (bytes): The quoted redirect URI.
+        code_challenge (bytes): The code challenge, as ASCII bytes.
+        quoted_method (bytes): The code challenge method, as ASCII bytes.
+        state (bytes): The state parameter, as ASCII bytes.
+        nonce (bytes): The nonce parameter, as ASCII bytes.
+
+    Returns:
+        str: The URL-encoded payload.
+    """
+    # code_challenge, state and nonce are base64url and need no escaping.
+    payload = (
+        b"client_id=%s"
+        b"&scope=%s"
+        b"&redirect_uri=%s"
+        b"&code_challenge=%s"
+        b"&code_challenge_method=%s"
+        b"&state=%s"
+        b"&nonce=%s"
+    ) % (quoted_client_id, quoted_scope, quoted_redirect_uri, code_challenge, quoted_method, state, nonce)
+    return payload.decode('ascii')
+
+def _generate_payload(client_id: str, redirect_uri: str, scope: str, code_challenge_method: str,
+                      code_verifier_length: int, state_length: int, nonce_length: int):
+    """
+    Generate the full OAuth2 payload with PKCE parameters without a `PKCE` instance.
+
+    Args:
+        client_id (str): Client ID for OAuth2 authentication.
+        redirect_uri (str): Redirect URI after authentication.
+        scope (str): Scope of the permissions being requested.
+        code_challenge_method (str): The method for code challenge generation ("S256" or "plain").
+        code_verifier_length (int): Length of the code verifier.
+        state_length (int): Length of the state parameter.
+        nonce_length (int): Length of the nonce parameter.
+
+    Returns:
+        Tuple[str, str]: URL-encoded payload and code verifier.
+    """
+    code_c = _code_c_for(code_challenge_method)
+    _validate_lengths(code_verifier_length, state_length, nonce_length)
+    _load_backends()
+
+    code_verifier, state, nonce = _tokens(code_verifier_length, state_length, nonce_length)
+    payload = _build_payload(_quote(client_id), _quote(scope), _quote(redirect_uri), code_c(code_verifier),
+                             code_challenge_method.encode('ascii'), state, nonce)
+    return payload, code_verifier.decode('ascii')
+
 def pkce(client_id: str, redirect_uri: str, scope: str, 
                           code_challenge_method: str = "S256", code_verifier_length: int = 32, 
                           state_length: int = 16, nonce_length: int = 16):
@@ -122,8 +353,8 @@ def pkce(client_id: str, redirect_uri: str, scope: str,
     Returns:
         Tuple[str, str]: URL-encoded payload and code verifier.
     """
-    pkce_instance = PKCE(client_id, redirect_uri, scope, code_challenge_method)
-    return pkce_instance._gen_p(code_verifier_length, state_length, nonce_length)
+    return _generate_payload(client_id, redirect_uri, scope, code_challenge_method,
+                             code_verifier_length, state_length, nonce_length)
 
 """
 The above code defines a class `PKCE` with a static method `pkce ` to generate the PKCE payload without instantiating the class.
@@ -132,7 +363,10 @@ class PKCE:
     """
     Class to handle the generation of PKCE (Proof Key for Code Exchange) parameters.
     """
-    def __init__(self, client_id: str, redirect_uri: str, scope: str, code_challenge_method: str = "S256"):
+    pkce = staticmethod(pkce)
+
+    def __init__(self, client_id: str, redirect_uri: str, scope: str, code_challenge_method: str = "S256",
+                 code_verifier_length: int = 32, state_length: int = 16, nonce_length: int = 16):
         """
         Initialize PKCE Generator with OAuth2 required parameters.
         
@@ -141,95 +375,211 @@ class PKCE:
             redirect_uri (str): Redirect URI after authentication.
             scope (str): Scope of the permissions being requested.
             code_challenge_method (str): The method for code challenge generation ("S256" or "plain").
+            code_verifier_length (int): Default length of the code verifier.
+            state_length (int): Default length of the state parameter.
+            nonce_length (int): Default length of the nonce parameter.
+
+        Raises:
+            ValueError: If the code challenge method or any length is not supported.
         """
+        _validate_lengths(code_verifier_length, state_length, nonce_length)
+        _load_backends()
+
+        self._code_verifier_length = code_verifier_length
+        self._state_length = state_length
+        self._nonce_length = nonce_length
+
         self.client_id = client_id
         self.redirect_uri = redirect_uri
         self.scope = scope
         self.code_challenge_method = code_challenge_method
 
-    def _code_v(self, length: int = 32) -> str:
+    # The length setters re-validate, so the defaults checked in __init__ stay valid.
+    @property
+    def code_verifier_length(self) -> int:
+        """Default length of the code verifier."""
+        return self._code_verifier_length
+
+    @code_verifier_length.setter
+    def code_verifier_length(self, value: int):
+        _validate_lengths(value, self._state_length, self._nonce_length)
+        self._code_verifier_length = value
+
+    @property
+    def state_length(self) -> int:
+        """Default length of the state parameter."""
+        return self._state_length
+
+    @state_length.setter
+    def state_length(self, value: int):
+        _validate_lengths(self._code_verifier_length, value, self._nonce_length)
+        self._state_length = value
+
+    @property
+    def nonce_length(self) -> int:
+        """Default length of the nonce parameter."""
+        return self._nonce_length
+
+    @nonce_length.setter
+    def nonce_length(self, value: int):
+        _validate_lengths(self._code_verifier_length, self._state_length, value)
+        self._nonce_length = value
+
+    # The setters below keep the pre-quoted payload fields in sync with the public attributes.
+    @property
+    def client_id(self):
+        """Client ID for OAuth2 authentication."""
+        return self._client_id
+
+    @client_id.setter
+    def client_id(self, value):
+        self._client_id = value
+        self._quoted_client_id = _quote(value)
+
+    @property
+    def redirect_uri(self):
+        """Redirect URI after authentication."""
+        return self._redirect_uri
+
+    @redirect_uri.setter
+    def redirect_uri(self, value):
+        self._redirect_uri = value
+        self._quoted_redirect_uri = _quote(value)
+
+    @property
+    def scope(self):
+        """Scope of the permissions being requested."""
+        return self._scope
+
+    @scope.setter
+    def scope(self, value):
+        self._scope = value
+        self._quoted_scope = _quote(value)
+
+    @property
+    def code_challenge_method(self) -> str:
+        """The method for code challenge generation ("S256" or "plain")."""
+        return self._code_challenge_method
+
+    @code_challenge_method.setter
+    def code_challenge_method(self, value: str):
+        self._code_c = _code_c_for(value)
+        self._code_challenge_method = value
+        self._quoted_method = value.encode('ascii')
+
+    def _code_v(self, length: int = None) -> bytes:
         """
         Generate a code verifier for PKCE.
 
         Args:
-            length (int): Length of the code verifier (43-128).
+            length (int): Length of the code verifier. Defaults to the instance's length.
 
         Returns:
-            str: The generated code verifier.
+            bytes: The generated code verifier, as ASCII bytes.
         """
-        if not 32 <= length <= 128:
-            raise ValueError("Code verifier length must be between 43 and 128 characters.")
-        
-        code_verifier = base64.urlsafe_b64encode(os.urandom(length)).rstrip(b'=').decode('ascii')
-        return code_verifier
+        return _tokens(self._lengths(length, None, None)[0])[0]
 
-    def _code_c(self, code_verifier: str) -> str:
+    def _s(self, length: int = None) -> str:
         """
-        Generate a code challenge based on the code verifier.
+        Generate a random state string.
 
         Args:
-            code_verifier (str): The code verifier.
+            length (int): Length of the state string. Defaults to the instance's length.
 
         Returns:
-            str: The generated code challenge.
+            str: The generated state.
         """
-        if self.code_challenge_method == "S256":
-            code_challenge = hashlib.sha256(code_verifier.encode('ascii')).digest()
-            return base64.urlsafe_b64encode(code_challenge).rstrip(b'=').decode('ascii')
-        elif self.code_challenge_method == "plain":
-            return code_verifier
-        else:
-            raise ValueError("Unsupported code_challenge_method. Choose either 'S256' or 'plain'.")
+        return _tokens(self._lengths(None, length, None)[1])[0].decode('ascii')
 
-    def _s(self, length: int = 16) -> str:
+    def _n(self, length: int = None) -> str:
         """
-        Generate a random state string.
+        Generate a random nonce string.
 
         Args:
-            length (int): Length of the state string.
+            length (int): Length of the nonce string. Defaults to the instance's length.
 
         Returns:
-            str: The generated state.
+            str: The generated nonce.
         """
-        return base64.urlsafe_b64encode(os.urandom(length)).decode('ascii').rstrip('=')
+        return _tokens(self._lengths(None, None, length)[2])[0].decode('ascii')
 
-    def _n(self, length: int = 16) -> str:
+    def _lengths(self, code_verifier_length: int, state_length: int, nonce_length: int) -> tuple:
         """
-        Generate a random nonce string.
+        Resolve per-call lengths against the instance defaults.
+
+        The defaults are validated whenever they are set. If any length is overridden, the resolved
+        combination of all three is validated again.
 
         Args:
-            length (int): Length of the nonce string.
+            code_verifier_length (int): Length of the code verifier, or None for the default.
+            state_length (int): Length of the state parameter, or None for the default.
+            nonce_length (int): Length of the nonce parameter, or None for the default.
 
         Returns:
-            str: The generated nonce.
+            Tuple[int, int, int]: The code verifier, state and nonce lengths.
         """
-        return base64.urlsafe_b64encode(os.urandom(length)).decode('ascii').rstrip('=')
-
-    def _gen_p(self, code_verifier_length: int = 32, state_length: int = 16, nonce_length: int = 16):
+        lengths = (
+            self._code_verifier_length if code_verifier_length is None else code_verifier_length,
+            self._state_length if state_length is None else state_length,
+            self._nonce_length if nonce_length is None else nonce_length,
+        )
+        if not (code_verifier_length is None and state_length is None and nonce_length is None):
+            _validate_lengths(*lengths)
+        return lengths
+
+    def _gen_p(self, code_verifier_length: int = None, state_length: int = None, nonce_length: int = None):
         """
         Generate the full OAuth2 payload with PKCE parameters.
 
         Args:
-            code_verifier_length (int): Length of the code verifier.
-            state_length (int): Length of the state parameter.
-            nonce_length (int): Length of the nonce parameter.
+            code_verifier_length (int): Length of the code verifier. Defaults to the instance's length.
+            state_length (int): Length of the state parameter. Defaults to the instance's length.
+            nonce_length (int): Length of the nonce parameter. Defaults to the instance's length.
 
         Returns:
             Tuple[str, str]: URL-encoded payload and code verifier.
         """
-        code_verifier = self._code_v(code_verifier_length)
-        code_challenge = self._code_c(code_verifier)
-        state = self._s(state_length)
-        nonce = self._n(nonce_length)
-
-        data = {
-            "client_id": self.client_id,
-            "scope": self.scope,
-            "redirect_uri": self.redirect_uri,
-            "code_challenge": code_challenge,
-            "code_challenge_method": self.code_challenge_method,
-            "state": state,
-            "nonce": nonce
-        }
-
-        return urllib.parse.urlencode(data), code_verifier
+        # One os.urandom call and one base64 pass cover all three components.
+        code_verifier, state, nonce = _tokens(*self._lengths(code_verifier_length, state_length, nonce_length))
+        return self._payload(self._code_c(code_verifier), state, nonce), code_verifier.decode('ascii')
+
+    def generate_many(self, n: int, code_verifier_length: int = None, state_length: int = None,
+                      nonce_length: int = None):
+        """
+        Generate several OAuth2 payloads with PKCE parameters in one call.
+
+        The entropy and base64 encoding for all payloads are produced in a single pass.
+
+        Args:
+            n (int): Number of payloads to generate.
+            code_verifier_length (int): Length of each code verifier. Defaults to the instance's length.
+            state_length (int): Length of each state parameter. Defaults to the instance's length.
+            nonce_length (int): Length of each nonce parameter. Defaults to the instance's length.
+
+        Returns:
+            List[Tuple[str, str]]: URL-encoded payload and code verifier for each pair.
+        """
+        tokens = _tokens(*self._lengths(code_verifier_length, state_length, nonce_length), count=n)
+
+        code_c = self._code_c
+        payload = self._payload
+        results = []
+        for i in range(0, len(tokens), 3):
+            code_verifier, state, nonce = tokens[i:i + 3]
+            results.append((payload(code_c(code_verifier), state, nonce), code_verifier.decode('ascii')))
+        return results
+
+    def _payload(self, code_challenge: bytes, state: bytes, nonce: bytes) -> str:
+        """
+        Assemble the URL-encoded OAuth2 payload from the instance's pre-quoted fields.
+
+        Args:
+            code_challenge (bytes): The code challenge, as ASCII bytes.
+            state (bytes): The state parameter, as ASCII bytes.
+            nonce (bytes): The nonce parameter, as ASCII bytes.
+
+        Returns:
+            str: The URL-encoded payload.
+        """
+        return _build_payload(self._quoted_client_id, self._quoted_scope, self._quoted_redirect_uri,
+                              code_challenge, self._quoted_method, state, nonce)
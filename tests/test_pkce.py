@@ -0,0 +1,187 @@
+import base64
+import hashlib
+import os
+import unittest
+import urllib.parse
+from unittest import mock
+
+from .. import PKCE, pkce
+
+
+class EntropyTest(unittest.TestCase):
+    """
+    Verifier, state and nonce must come from a single os.urandom call.
+    """
+    def test_single_draw_per_payload(self):
+        with mock.patch("os.urandom", wraps=os.urandom) as urandom:
+            pkce("client", "https://example.com/cb", "openid")
+            PKCE("client", "https://example.com/cb", "openid")._gen_p(40, 7, 9)
+
+        self.assertEqual(urandom.call_count, 2)
+
+
+def _expected_payload(payload: str, client_id, redirect_uri, scope, code_challenge_method: str) -> str:
+    """
+    Rebuild the payload with urllib.parse.urlencode, reusing its generated tokens.
+    """
+    query = dict(urllib.parse.parse_qsl(payload, keep_blank_values=True))
+    return urllib.parse.urlencode({
+        "client_id": client_id,
+        "scope": scope,
+        "redirect_uri": redirect_uri,
+        "code_challenge": query["code_challenge"],
+        "code_challenge_method": code_challenge_method,
+        "state": query["state"],
+        "nonce": query["nonce"],
+    })
+
+
+class PayloadTest(unittest.TestCase):
+    """
+    Payloads must match what urllib.parse.urlencode produces for the same fields.
+    """
+    FIELDS = [
+        ("client", "https://example.com/cb", "openid profile"),
+        (b"client", b"https://example.com/cb?a=1&b=2", b"openid email"),
+        (123, None, 4.5),
+        ("cli\u00e9nt \u540d", "https://\u00e9xample.com/r\u00e9ponse", "scope/\u2603+x"),
+    ]
+
+    def test_pkce_matches_urlencode(self):
+        for client_id, redirect_uri, scope in self.FIELDS:
+            for method in ("S256", "plain"):
+                with self.subTest(client_id=client_id, method=method):
+                    payload, _ = pkce(client_id, redirect_uri, scope, method)
+                    self.assertEqual(payload, _expected_payload(payload, client_id, redirect_uri, scope, method))
+
+    def test_instance_matches_urlencode(self):
+        for client_id, redirect_uri, scope in self.FIELDS:
+            with self.subTest(client_id=client_id):
+                payload, _ = PKCE(client_id, redirect_uri, scope)._gen_p()
+                self.assertEqual(payload, _expected_payload(payload, client_id, redirect_uri, scope, "S256"))
+
+    def test_reassigned_fields_are_used(self):
+        generator = PKCE("client", "https://example.com/cb", "openid")
+        generator.client_id = "other client"
+        generator.scope = b"email"
+        generator.redirect_uri = 42
+        generator.code_challenge_method = "plain"
+
+        payload, code_verifier = generator._gen_p()
+        self.assertEqual(payload, _expected_payload(payload, "other client", 42, b"email", "plain"))
+        self.assertEqual(dict(urllib.parse.parse_qsl(payload))["code_challenge"], code_verifier)
+
+    def test_reassigning_bad_method_keeps_previous(self):
+        generator = PKCE("client", "https://example.com/cb", "openid")
+        with self.assertRaises(ValueError):
+            generator.code_challenge_method = "S512"
+        self.assertEqual(generator.code_challenge_method, "S256")
+
+
+class GenerateManyTest(unittest.TestCase):
+    """
+    Batches must be equivalent to generating each payload on its own.
+    """
+    def setUp(self):
+        self.generator = PKCE("client", "https://example.com/cb", "openid")
+
+    def test_zero(self):
+        self.assertEqual(self.generator.generate_many(0), [])
+
+    def test_challenges_match_verifiers(self):
+        results = self.generator.generate_many(200)
+
+        self.assertEqual(len(results), 200)
+        for payload, code_verifier in results:
+            digest = hashlib.sha256(code_verifier.encode('ascii')).digest()
+            expected = base64.urlsafe_b64encode(digest).rstrip(b'=').decode('ascii')
+            self.assertEqual(dict(urllib.parse.parse_qsl(payload))["code_challenge"], expected)
+            self.assertEqual(payload, _expected_payload(payload, "client", "https://example.com/cb", "openid", "S256"))
+
+    def test_verifiers_unique(self):
+        results = self.generator.generate_many(500)
+        self.assertEqual(len({code_verifier for _, code_verifier in results}), 500)
+
+    def test_overridden_lengths(self):
+        for payload, code_verifier in self.generator.generate_many(5, 40, 5, 0):
+            query = dict(urllib.parse.parse_qsl(payload, keep_blank_values=True))
+            self.assertEqual(len(code_verifier), 54)
+            self.assertEqual(len(query["state"]), 7)
+            self.assertEqual(query["nonce"], "")
+
+
+class ChallengeTest(unittest.TestCase):
+    """
+    Code challenges must follow RFC 7636.
+    """
+    def test_rfc7636_appendix_b(self):
+        generator = PKCE("client", "https://example.com/cb", "openid")
+        code_challenge = generator._code_c(b"dBjftJeZ4CVP-mB92K27uhbUJU1p1r_wW1gFWFOEjXk")
+        self.assertEqual(code_challenge, b"E9Melhoa2OwvFrEMTJguCHaoeK1t8URWbuGJSstw-cM")
+
+    def test_plain_returns_verifier(self):
+        generator = PKCE("client", "https://example.com/cb", "openid", "plain")
+        self.assertEqual(generator._code_c(b"dBjftJeZ4CVP-mB92K27uhbUJU1p1r_wW1gFWFOEjXk"),
+                         b"dBjftJeZ4CVP-mB92K27uhbUJU1p1r_wW1gFWFOEjXk")
+
+
+class LengthValidationTest(unittest.TestCase):
+    """
+    Verifiers must be 32 to 96 random bytes (43 to 128 characters); state and nonce may be empty.
+    """
+    def test_code_verifier_bounds(self):
+        for length, characters in [(32, 43), (96, 128)]:
+            with self.subTest(length=length):
+                self.assertEqual(len(pkce("c", "r", "s", code_verifier_length=length)[1]), characters)
+                self.assertEqual(len(PKCE("c", "r", "s", code_verifier_length=length)._gen_p()[1]), characters)
+        for length in (31, 97):
+            with self.subTest(length=length):
+                with self.assertRaises(ValueError):
+                    pkce("c", "r", "s", code_verifier_length=length)
+                with self.assertRaises(ValueError):
+                    PKCE("c", "r", "s", code_verifier_length=length)
+                with self.assertRaises(ValueError):
+                    PKCE("c", "r", "s")._gen_p(length)
+
+    def test_empty_state_and_nonce(self):
+        payload, _ = pkce("c", "r", "s", state_length=0, nonce_length=0)
+        query = dict(urllib.parse.parse_qsl(payload, keep_blank_values=True))
+        self.assertEqual((query["state"], query["nonce"]), ("", ""))
+
+    def test_negative_state_and_nonce(self):
+        for lengths in [dict(state_length=-1), dict(nonce_length=-5)]:
+            with self.subTest(**lengths):
+                with self.assertRaises(ValueError):
+                    pkce("c", "r", "s", **lengths)
+                with self.assertRaises(ValueError):
+                    PKCE("c", "r", "s", **lengths)
+                with self.assertRaises(ValueError):
+                    PKCE("c", "r", "s").generate_many(2, **lengths)
+
+    def test_non_integer_lengths(self):
+        with self.assertRaises(TypeError):
+            pkce("c", "r", "s", state_length=16.0)
+        with self.assertRaises(TypeError):
+            PKCE("c", "r", "s", code_verifier_length=32.0)
+
+    def test_constructor_rejects_bad_method(self):
+        with self.assertRaises(ValueError):
+            PKCE("c", "r", "s", "S512")
+        with self.assertRaises(ValueError):
+            pkce("c", "r", "s", "S512")
+
+    def test_reassigned_lengths_validated(self):
+        generator = PKCE("c", "r", "s")
+        for attribute, value in [("code_verifier_length", 5), ("code_verifier_length", 200),
+                                 ("state_length", -1), ("nonce_length", -1)]:
+            with self.subTest(attribute=attribute, value=value):
+                with self.assertRaises(ValueError):
+                    setattr(generator, attribute, value)
+        self.assertEqual(len(generator._gen_p()[1]), 43)
+
+        generator.code_verifier_length = 96
+        self.assertEqual(len(generator._gen_p()[1]), 128)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import base64
+import random
+import unittest
+from unittest import mock
+
+from .. import _tokens
+
+
+def _segments(buf: bytes, lengths):
+    """
+    Split a drawn buffer into the per-token segments, each starting on a 3-byte boundary.
+    """
+    segments = []
+    offset = 0
+    for length in lengths:
+        segments.append(buf[offset:offset + length])
+        offset += (length + 2) // 3 * 3
+    return segments
+
+
+class TokensTest(unittest.TestCase):
+    """
+    `_tokens` must produce exactly what encoding each random segment on its own would.
+    """
+    def setUp(self):
+        rng = random.Random(0)
+        self.drawn = []
+
+        def urandom(n):
+            buf = rng.randbytes(n)
+            self.drawn.append(buf)
+            return buf
+
+        patcher = mock.patch("os.urandom", urandom)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_tokens_match_independent_encoding(self):
+        # Covers every residue mod 3 for each position, including empty tokens.
+        for lengths in [(32, 16, 16), (33, 17, 18), (34, 0, 1), (96, 2, 3), (1,), (2,), (3,), (5, 4, 3, 2, 1, 0)]:
+            with self.subTest(lengths=lengths):
+                self.drawn.clear()
+                tokens = _tokens(*lengths)
+
+                self.assertEqual(len(self.drawn), 1)
+                segments = _segments(self.drawn[0], lengths)
+                self.assertEqual(len(tokens), len(segments))
+                for token, segment in zip(tokens, segments):
+                    self.assertEqual(token, base64.urlsafe_b64encode(segment).rstrip(b'='))
+
+    def test_repeated_groups_match_independent_encoding(self):
+        for lengths in [(32, 16, 16), (33, 17, 18), (34, 0, 1), (0, 0)]:
+            with self.subTest(lengths=lengths):
+                self.drawn.clear()
+                tokens = _tokens(*lengths, count=4)
+
+                self.assertEqual(len(self.drawn), 1)
+                segments = _segments(self.drawn[0], lengths * 4)
+                self.assertEqual(len(tokens), len(segments))
+                for token, segment in zip(tokens, segments):
+                    self.assertEqual(token, base64.urlsafe_b64encode(segment).rstrip(b'='))
+
+    def test_invalid_lengths_rejected(self):
+        for lengths in [(32, 16, -5), (-1,), (32, -4, 16)]:
+            with self.subTest(lengths=lengths):
+                with self.assertRaises(ValueError):
+                    _tokens(*lengths)
+        with self.assertRaises(TypeError):
+            _tokens(32, 2.5, 16)
+        self.assertEqual(self.drawn, [])
+
+
+if __name__ == "__main__":
+    unittest.main()